@@ -1,6 +1,7 @@
 """Enhanced Grok client with tool calling support."""
 
 import json
+from datetime import datetime
 
 from loguru import logger
 from openai import OpenAI
@@ -165,30 +166,39 @@ class GrokClient:
                     )
 
                     # Execute each tool call
-                    for tool_call in message.tool_calls:
-                        func_name = tool_call.function.name
-                        func_args = json.loads(tool_call.function.arguments)
-
-                        logger.info(f"Executing tool: {func_name}")
-                        tool_calls_made.append({"name": func_name, "arguments": func_args})
-
-                        # Execute the tool
-                        result = await execute_tool(func_name, func_args)
-
-                        # Save tool result to chat history
-                        result_preview = json.dumps(result)[:500]
-                        self.db.save_chat_message(
-                            role="system", content=f"[Tool: {func_name}] {result_preview}"
-                        )
-
-                        # Add tool result
-                        current_messages.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": tool_call.id,
-                                "content": json.dumps(result),
-                            }
-                        )
+                    tool_results = []
+                    try:
+                        for tool_call in message.tool_calls:
+                            func_name = tool_call.function.name
+                            func_args = json.loads(tool_call.function.arguments)
+
+                            logger.info(f"Executing tool: {func_name}")
+                            tool_calls_made.append({"name": func_name, "arguments": func_args})
+
+                            # Execute the tool
+                            result = await execute_tool(func_name, func_args)
+
+                            # Collect tool result for chat history
+                            result_preview = json.dumps(result)[:500]
+                            tool_results.append(
+                                {
+                                    "role": "system",
+                                    "content": f"[Tool: {func_name}] {result_preview}",
+                                    "timestamp": datetime.utcnow(),
+                                }
+                            )
+
+                            # Add tool result
+                            current_messages.append(
+                                {
+                                    "role": "tool",
+                                    "tool_call_id": tool_call.id,
+                                    "content": json.dumps(result),
+                                }
+                            )
+                    finally:
+                        # Persist whatever ran, even if a later tool raised
+                        self.db.save_chat_messages_bulk(tool_results)
 
                     # Continue the loop for potential follow-up
                     continue
@@ -262,7 +272,7 @@ class GrokClient:
 
         result = await self.chat_with_tools(messages, temperature=0.5)
 
-        self.db.log(
+        self.db.log_async(
             message=f"Trading analysis complete: {len(result.get('tool_calls', []))} tool calls",
             component="grok",
             level="INFO",
@@ -34,7 +34,7 @@ class ToolExecutor:
         """Execute a tool and return the result."""
         logger.info(f"Executing tool: {tool_name} with args: {arguments}")
 
-        self.db.log(
+        self.db.log_async(
             message=f"Tool call: {tool_name}", component="tools", level="INFO", details=arguments
         )
 
@@ -61,7 +61,7 @@ class ToolExecutor:
 
             result = await handler(arguments)
 
-            self.db.log(
+            self.db.log_async(
                 message=f"Tool result: {tool_name}",
                 component="tools",
                 level="DEBUG",
@@ -72,7 +72,7 @@ class ToolExecutor:
 
         except Exception as e:
             logger.error(f"Tool execution error: {e}")
-            self.db.log(
+            self.db.log_async(
                 message=f"Tool error: {tool_name} - {str(e)}", component="tools", level="ERROR"
             )
             return {"error": str(e)}
@@ -301,10 +301,11 @@ class ToolExecutor:
         try:
             tickers = self.yahoo.get_trending_tickers()[:limit]
 
-            # Get current prices for each
+            # Get current prices for all of them in one request
+            prices = self.yahoo.get_stock_prices(tickers)
             trending = []
             for symbol in tickers:
-                price = self.yahoo.get_stock_price(symbol)
+                price = prices.get(symbol)
                 if price:
                     trending.append({"symbol": symbol, "price": round(price, 2)})
 
@@ -334,7 +335,7 @@ class ToolExecutor:
         next_plan = args.get("next_action_plan", "")
 
         # Log to database
-        self.db.log(
+        self.db.log_async(
             message=f"Hour complete: {summary}",
             component="trading",
             level="INFO",
@@ -376,7 +377,9 @@ class ToolExecutor:
         search_query = f"{symbol} stock {query}" if symbol else query
 
         # Log the search request
-        self.db.log(message=f"Live news search: {search_query}", component="news", level="INFO")
+        self.db.log_async(
+            message=f"Live news search: {search_query}", component="news", level="INFO"
+        )
 
         try:
             # Use Grok's live search for real-time news
@@ -410,7 +413,7 @@ class ToolExecutor:
                 elif isinstance(citation, str):
                     formatted_citations.append({"url": citation})
 
-            self.db.log(
+            self.db.log_async(
                 message=f"News search completed: {len(formatted_citations)} sources found",
                 component="news",
                 level="INFO",
@@ -468,7 +471,7 @@ class ToolExecutor:
             "created": datetime.now().isoformat(),
         }
 
-        self.db.log(
+        self.db.log_async(
             message=f"Stop-loss set for {symbol} at ${stop_price:.2f}",
             component="orders",
             level="INFO",
@@ -518,7 +521,7 @@ class ToolExecutor:
             "created": datetime.now().isoformat(),
         }
 
-        self.db.log(
+        self.db.log_async(
             message=f"Take-profit set for {symbol} at ${target_price:.2f}",
             component="orders",
             level="INFO",
@@ -93,8 +93,11 @@ class TradingAgent:
             trending = self.yahoo.get_trending_tickers()
             market_data = {}
 
-            for symbol in trending[:5]:  # Analyze top 5
-                price = self.yahoo.get_stock_price(symbol)
+            symbols = trending[:5]  # Analyze top 5
+            prices = self.yahoo.get_stock_prices(symbols)
+
+            for symbol in symbols:
+                price = prices.get(symbol)
                 history = self.yahoo.get_price_history(symbol, period="5d", interval="1h")
                 if price and history:
                     market_data[symbol] = {
@@ -46,7 +46,7 @@ async def take_portfolio_snapshot():
 
         # Save snapshot
         positions_data = [p.model_dump() for p in positions]
-        db.save_portfolio_snapshot(
+        db.save_portfolio_snapshot_async(
             total_value=total_value,
             cash=cash,
             holdings_value=holdings_value,
@@ -145,7 +145,7 @@ async def lifespan(app: FastAPI):
     logger.info("Scheduler started")
 
     # Log startup
-    db.log(
+    db.log_async(
         message="Grok Trading Bot API started",
         component="api",
         level="INFO",
@@ -159,7 +159,8 @@ async def lifespan(app: FastAPI):
     scheduler.stop()
     await ibkr.disconnect()
 
-    db.log(message="Grok Trading Bot API stopped", component="api", level="INFO")
+    db.log_async(message="Grok Trading Bot API stopped", component="api", level="INFO")
+    db.flush_writes()
 
 
 app = FastAPI(
@@ -237,7 +238,7 @@ async def disconnect_broker(reconnect_minutes: int = 5):
 
     await ibkr.disconnect()
 
-    db.log(
+    db.log_async(
         message=f"IBKR disconnected for mobile access. Will reconnect in {reconnect_minutes} minutes.",
         component="broker",
         level="INFO",
@@ -249,7 +250,7 @@ async def disconnect_broker(reconnect_minutes: int = 5):
         if not ibkr.connected:
             connected = await ibkr.connect()
             if connected:
-                db.log(
+                db.log_async(
                     message="IBKR auto-reconnected after mobile access period",
                     component="broker",
                     level="INFO",
@@ -284,7 +285,7 @@ async def reconnect_broker():
     connected = await ibkr.connect()
 
     if connected:
-        db.log(message="IBKR manually reconnected", component="broker", level="INFO")
+        db.log_async(message="IBKR manually reconnected", component="broker", level="INFO")
         await manager.broadcast_log(
             {"level": "INFO", "message": "Broker reconnected", "component": "broker"}
         )
@@ -25,7 +25,11 @@ async def ibkr_health():
     if ibkr.connected:
         try:
             cash = await ibkr.get_cash_balance()
-            return {"connected": True, "cash_balance": cash}
+            return {"connected": True, "cash_balance": cash, "stats": ibkr.get_client_stats()}
         except Exception as e:
-            return {"connected": False, "error": str(e)}
-    return {"connected": False, "error": "Not connected to IBKR"}
+            return {"connected": False, "error": str(e), "stats": ibkr.get_client_stats()}
+    return {
+        "connected": False,
+        "error": "Not connected to IBKR",
+        "stats": ibkr.get_client_stats(),
+    }
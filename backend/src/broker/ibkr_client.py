@@ -1,39 +1,137 @@
 import asyncio
-import math
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import ClassVar
 
-import nest_asyncio
 from ib_insync import IB, Contract, LimitOrder, MarketOrder, Stock
+from ib_insync import Position as IBPosition
 from ib_insync import Trade as IBTrade
 from loguru import logger
 
 from src.config import get_settings
 from src.models import OrderType, Position, TradeAction, TradeOrder, TradeResult
 
-# Enable nested event loops for ib_insync compatibility
-nest_asyncio.apply()
-
 # Thread executor for IBKR sync operations
 _executor = ThreadPoolExecutor(max_workers=1)
 
+_INFINITIES = (float("inf"), float("-inf"))
+
+# Account summary tags we report; accountSummary() returns ~100 of them
+_ACCOUNT_SUMMARY_TAGS = frozenset({"TotalCashValue", "NetLiquidation", "GrossPositionValue"})
+
+# IBKR error code for an unknown or changed security definition
+_NO_SECURITY_DEFINITION = 200
+
+# Order fill timeouts. Market orders wait ~1.5x the observed p95 fill latency once
+# enough fills have been seen; limit orders wait until expire_at, capped so a resting
+# order never holds the single IBKR thread for longer than before.
+_DEFAULT_MARKET_TIMEOUT_SECONDS = 30.0
+_MIN_MARKET_TIMEOUT_SECONDS = 5.0
+_MAX_LIMIT_TIMEOUT_SECONDS = 30.0
+_FILL_LATENCY_SAMPLES = 200
+_MIN_FILL_LATENCY_SAMPLES = 20
+_FILL_P95_REFRESH_SECONDS = 60.0
+
+# Order bulkhead: concurrent submissions allowed, and how long a caller waits for a slot
+_MAX_INFLIGHT_ORDERS = 5
+_ORDER_SLOT_TIMEOUT_SECONDS = 2.0
+
+# IBKR market data circuit breaker: skip IBKR for every symbol while more than half
+# of the non-subscription price requests in the last minute have failed
+_BREAKER_WINDOW_SECONDS = 60.0
+_BREAKER_MIN_SAMPLES = 5
+_BREAKER_FAILURE_RATE = 0.5
+
+# How long reqMktData snapshots are given to arrive: explicit quotes can afford longer,
+# position pricing runs every snapshot tick and keeps the shorter wait
+_SNAPSHOT_WAIT_SECONDS = 2.0
+_POSITION_SNAPSHOT_WAIT_SECONDS = 1.0
+
+# How old a cached quote may be when pricing held positions
+_POSITION_QUOTE_MAX_AGE_SECONDS = 30.0
+
+
+@dataclass
+class PositionState:
+    """A held position, kept current from IBKR position pushes."""
+
+    qty: int
+    avg_cost: float
+
 
 class IBKRClient:
     """Interactive Brokers client using ib_insync."""
 
+    # nest_asyncio patches asyncio process-wide, so only do it once a client connects
+    _nest_applied: ClassVar[bool] = False
+
     def __init__(self):
         self.settings = get_settings()
         self.ib = IB()
         self._connected = False
-        # Track symbols with market data subscription issues (error 10089)
-        self._market_data_failures: dict[str, datetime] = {}
-        self._market_data_cooldown_minutes: int = 60
+        # Track symbols with market data subscription issues (error 10089), keyed to the
+        # time.monotonic() of the failure so wall-clock jumps can't skew the cooldown
+        self._market_data_failures: dict[str, float] = {}
+        self._market_data_cooldown_seconds: float = 3600.0
         self._yahoo = None  # Lazy-loaded Yahoo client
+        # Outcome counters for the IBKR -> Yahoo -> avg cost price fallback chain
+        self._price_stats = {
+            "ibkr_ok": 0,
+            "ibkr_fail_10089": 0,
+            "ibkr_fail_other": 0,
+            "yahoo_ok": 0,
+            "yahoo_fail": 0,
+            "fallback_avg_cost": 0,
+        }
+        # (time.monotonic(), failed) for recent IBKR price requests, for the breaker.
+        # Written on the IBKR thread and read by monitoring on the event loop.
+        self._ibkr_price_outcomes: deque[tuple[float, bool]] = deque(maxlen=1000)
+        self._ibkr_price_outcomes_lock = threading.Lock()
+        # Qualified stock contracts keyed by symbol, reused across calls
+        self._contract_cache: dict[str, Contract] = {}
+        # Live positions keyed by symbol, maintained from positionEvent pushes for the
+        # trading account (settings.ibkr_account, else the first managed account)
+        self._positions: dict[str, PositionState] = {}
+        self._account: str = self.settings.ibkr_account
+        # Recent fill latencies (seconds) per order type, and their cached p95
+        self._fill_latency: dict[OrderType, deque[float]] = {
+            order_type: deque(maxlen=_FILL_LATENCY_SAMPLES) for order_type in OrderType
+        }
+        self._fill_p95: dict[OrderType, float] = {}
+        self._fill_p95_refreshed_at = float("-inf")
+        self._order_slots = asyncio.Semaphore(_MAX_INFLIGHT_ORDERS)
+        self._inflight_orders = 0
+        # Latest quote per symbol: (time.monotonic() when fetched, price)
+        self._quote_cache: dict[str, tuple[float, float]] = {}
+        # In-flight requests keyed by name, shared between concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.ib.errorEvent += self._on_error
+        self.ib.positionEvent += self._on_position
 
     @property
     def connected(self) -> bool:
         return self._connected and self.ib.isConnected()
 
+    @property
+    def inflight_orders(self) -> int:
+        """Number of orders currently being submitted."""
+        return self._inflight_orders
+
+    def get_client_stats(self) -> dict:
+        """Get price fallback counters and order/breaker state for monitoring."""
+        return {
+            **self._price_stats,
+            "ibkr_fail_rate_1m": self._ibkr_failure_rate(),
+            "ibkr_breaker_open": self._ibkr_breaker_open(),
+            "inflight_orders": self._inflight_orders,
+        }
+
     @property
     def yahoo(self):
         """Lazy load Yahoo client to avoid circular imports."""
@@ -43,15 +141,104 @@ class IBKRClient:
             self._yahoo = get_yahoo_client()
         return self._yahoo
 
+    async def _single_flight(self, key: str, request: Callable[[], Awaitable]):
+        """Run request once for all concurrent callers of the same key."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(request())
+            self._inflight[key] = future
+
+            def _release(done: asyncio.Future):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            future.add_done_callback(_release)
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(future)
+
+    def _on_error(self, req_id: int, error_code: int, error_string: str, contract: Contract | None):
+        """Drop cached contracts that IBKR no longer recognizes."""
+        if error_code == _NO_SECURITY_DEFINITION and contract is not None:
+            self._contract_cache.pop(contract.symbol, None)
+
+    def _trading_account(self) -> str:
+        """Get the account whose positions are tracked, or "" until IBKR reports one."""
+        if not self._account:
+            accounts = self.ib.managedAccounts()
+            if accounts:
+                self._account = accounts[0]
+        return self._account
+
+    def _on_position(self, position: IBPosition):
+        """Apply a position update pushed by IBKR to the in-memory map."""
+        # positionEvent fires for every managed account; other accounts' pushes would
+        # overwrite or pop this account's entry for the same symbol
+        account = self._trading_account()
+        if account and position.account != account:
+            return
+
+        symbol = position.contract.symbol
+        if position.position == 0:
+            self._positions.pop(symbol, None)
+            return
+
+        qty = int(position.position)
+        avg_cost = self._safe_float(position.avgCost, 0.0)
+        state = self._positions.get(symbol)
+        if state is None:
+            self._positions[symbol] = PositionState(qty=qty, avg_cost=avg_cost)
+        else:
+            state.qty = qty
+            state.avg_cost = avg_cost
+
+    def _qualified(self, symbol: str) -> Contract:
+        """Get a qualified stock contract, only hitting IBKR on first use."""
+        contract = self._contract_cache.get(symbol)
+        if contract is None:
+            contract = Stock(symbol, "SMART", "USD")
+            self.ib.qualifyContracts(contract)
+            # Unknown symbols come back without a conId; don't cache those
+            if contract.conId:
+                self._contract_cache[symbol] = contract
+        return contract
+
+    def _ibkr_failure_rate(self) -> float | None:
+        """Get the last minute's IBKR price failure rate, or None if there are too few samples."""
+        cutoff = time.monotonic() - _BREAKER_WINDOW_SECONDS
+        with self._ibkr_price_outcomes_lock:
+            outcomes = self._ibkr_price_outcomes
+            while outcomes and outcomes[0][0] < cutoff:
+                outcomes.popleft()
+            recent = list(outcomes)
+        if len(recent) < _BREAKER_MIN_SAMPLES:
+            return None
+        return sum(failed for _, failed in recent) / len(recent)
+
+    def _record_price_outcome(self, at: float, failed: bool) -> None:
+        """Record an IBKR price request outcome for the breaker."""
+        with self._ibkr_price_outcomes_lock:
+            self._ibkr_price_outcomes.append((at, failed))
+
+    def _ibkr_breaker_open(self) -> bool:
+        """Whether IBKR market data looks globally unhealthy right now."""
+        rate = self._ibkr_failure_rate()
+        return rate is not None and rate > _BREAKER_FAILURE_RATE
+
+    def _mark_market_data_ok(self):
+        """Record a price successfully served by IBKR."""
+        self._price_stats["ibkr_ok"] += 1
+        self._record_price_outcome(time.monotonic(), False)
+
     def _should_try_ibkr_market_data(self, symbol: str) -> bool:
         """Check if we should attempt IBKR market data for this symbol."""
-        if symbol not in self._market_data_failures:
-            return True
+        if self._ibkr_breaker_open():
+            return False
 
-        failure_time = self._market_data_failures[symbol]
-        cooldown = timedelta(minutes=self._market_data_cooldown_minutes)
+        failure_time = self._market_data_failures.get(symbol)
+        if failure_time is None:
+            return True
 
-        if datetime.now() - failure_time > cooldown:
+        if time.monotonic() - failure_time > self._market_data_cooldown_seconds:
             # Cooldown expired, remove from failures and retry
             del self._market_data_failures[symbol]
             return True
@@ -61,17 +248,36 @@ class IBKRClient:
     def _mark_market_data_failure(self, symbol: str, error_msg: str):
         """Mark a symbol as having market data subscription issues."""
         error_str = str(error_msg).lower()
+        now = time.monotonic()
         # Detect error 10089 or other market data subscription issues
         if "10089" in error_str or "no market data" in error_str or "no valid price" in error_str:
-            self._market_data_failures[symbol] = datetime.now()
+            self._price_stats["ibkr_fail_10089"] += 1
+            self._record_price_outcome(now, False)
+            self._market_data_failures[symbol] = now
             logger.warning(
                 f"Market data issue for {symbol}. Using Yahoo fallback. "
-                f"Will not retry IBKR for {self._market_data_cooldown_minutes} minutes."
+                f"Will not retry IBKR for {self._market_data_cooldown_seconds / 60:.0f} minutes."
             )
+        else:
+            # Anything else points at IBKR itself rather than this symbol
+            self._price_stats["ibkr_fail_other"] += 1
+            self._record_price_outcome(now, True)
+
+    @classmethod
+    def _apply_nest_asyncio(cls):
+        """Enable nested event loops for ib_insync's sync API (once per process)."""
+        if not cls._nest_applied:
+            import nest_asyncio
+
+            nest_asyncio.apply()
+            cls._nest_applied = True
 
     def _sync_connect(self) -> bool:
         """Synchronous connect - runs in thread."""
         try:
+            # Applied here, on the IBKR thread, so it patches that thread's plain asyncio
+            # loop rather than the server's running loop (which may be uvloop)
+            self._apply_nest_asyncio()
             self.ib.connect(
                 self.settings.ibkr_host,
                 self.settings.ibkr_port,
@@ -79,6 +285,9 @@ class IBKRClient:
                 readonly=False,
                 timeout=10,
             )
+            # Seed the position map; positionEvent keeps it current from here
+            for position in self.ib.positions():
+                self._on_position(position)
             return True
         except Exception as e:
             logger.error(f"IBKR sync connect failed: {e}")
@@ -116,14 +325,16 @@ class IBKRClient:
         if self.connected:
             self.ib.disconnect()
             self._connected = False
+            self._contract_cache.clear()
+            self._positions.clear()
+            self._account = self.settings.ibkr_account
             logger.info("Disconnected from IBKR")
 
     def _sync_get_account_summary(self) -> dict:
         """Sync account summary - runs in thread."""
         summary = {}
-        account_values = self.ib.accountSummary()
-        for av in account_values:
-            if av.tag in ["TotalCashValue", "NetLiquidation", "GrossPositionValue"]:
+        for av in self.ib.accountSummary():
+            if av.tag in _ACCOUNT_SUMMARY_TAGS:
                 summary[av.tag] = float(av.value)
         return summary
 
@@ -133,7 +344,10 @@ class IBKRClient:
             raise ConnectionError("Not connected to IBKR")
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, self._sync_get_account_summary)
+        return await self._single_flight(
+            "account_summary",
+            lambda: loop.run_in_executor(_executor, self._sync_get_account_summary),
+        )
 
     async def get_cash_balance(self) -> float:
         """Get available cash balance."""
@@ -147,135 +361,149 @@ class IBKRClient:
 
     def _safe_float(self, value, default: float = 0.0) -> float:
         """Convert value to float safely, handling nan and None."""
+        # Fast path: ticker fields are usually already floats. f != f is the NaN test.
+        if type(value) is float:
+            return default if value != value or value in _INFINITIES else value
         if value is None:
             return default
         try:
             f = float(value)
-            return default if math.isnan(f) or math.isinf(f) else f
+            return default if f != f or f in _INFINITIES else f
         except (TypeError, ValueError):
             return default
 
-    def _sync_get_positions(self) -> list[dict]:
-        """Sync get positions - runs in thread with Yahoo Finance fallback."""
-        positions = []
-        ib_positions = self.ib.positions()
-
-        for pos in ib_positions:
-            if pos.position != 0:
-                symbol = pos.contract.symbol
-                avg_price = self._safe_float(pos.avgCost, 0.0)
-                current_price = avg_price  # Default fallback
-                price_source = "avg_cost"
-
-                # Try IBKR first if no known market data issues
-                if self._should_try_ibkr_market_data(symbol):
-                    try:
-                        self.ib.qualifyContracts(pos.contract)
-                        ticker = self.ib.reqMktData(pos.contract, snapshot=True)
-                        self.ib.sleep(1)
-                        self.ib.cancelMktData(pos.contract)
-
-                        last = self._safe_float(ticker.last, 0.0)
-                        close = self._safe_float(ticker.close, 0.0)
-
-                        if last > 0:
-                            current_price = last
-                            price_source = "ibkr"
-                        elif close > 0:
-                            current_price = close
-                            price_source = "ibkr"
-                        else:
-                            # IBKR returned no valid price, likely subscription issue
-                            self._mark_market_data_failure(symbol, "no valid price")
-                    except Exception as e:
-                        error_msg = str(e)
-                        logger.warning(f"IBKR price failed for {symbol}: {error_msg}")
-                        self._mark_market_data_failure(symbol, error_msg)
-
-                # Try Yahoo Finance as fallback if IBKR didn't provide a valid price
-                if price_source == "avg_cost":
-                    try:
-                        yahoo_price = self.yahoo.get_stock_price(symbol)
-                        if yahoo_price and yahoo_price > 0:
-                            current_price = yahoo_price
-                            price_source = "yahoo"
-                    except Exception as e:
-                        logger.warning(f"Yahoo price also failed for {symbol}: {e}")
-
-                positions.append(
-                    {
-                        "symbol": symbol,
-                        "quantity": int(pos.position),
-                        "avg_price": avg_price,
-                        "current_price": current_price,
-                    }
-                )
-
-        return positions
-
-    async def get_positions(self) -> list[Position]:
-        """Get all current positions."""
-        if not self.connected:
-            raise ConnectionError("Not connected to IBKR")
-
-        loop = asyncio.get_event_loop()
-        pos_data = await loop.run_in_executor(_executor, self._sync_get_positions)
-
-        return [Position(**p) for p in pos_data]
-
-    async def _get_current_price(self, contract: Contract) -> float | None:
-        """Get current market price for a contract with Yahoo fallback."""
-        symbol = contract.symbol
-
+    def _sync_get_price(
+        self, symbol: str, snapshot_wait_s: float = _SNAPSHOT_WAIT_SECONDS
+    ) -> float | None:
+        """Sync price lookup - runs in thread, IBKR first with Yahoo fallback."""
         # Try IBKR first if no known market data issues
         if self._should_try_ibkr_market_data(symbol):
             try:
-                self.ib.qualifyContracts(contract)
+                contract = self._qualified(symbol)
                 ticker = self.ib.reqMktData(contract, snapshot=True)
-                self.ib.sleep(2)  # Wait for data
+                self.ib.sleep(snapshot_wait_s)
                 self.ib.cancelMktData(contract)
 
-                if ticker.last and ticker.last > 0:
-                    return ticker.last
-                elif ticker.close and ticker.close > 0:
-                    return ticker.close
-                else:
-                    # IBKR returned no valid price
-                    self._mark_market_data_failure(symbol, "no valid price")
+                last = self._safe_float(ticker.last, 0.0)
+                close = self._safe_float(ticker.close, 0.0)
+
+                if last > 0 or close > 0:
+                    self._mark_market_data_ok()
+                    return last if last > 0 else close
+                # IBKR returned no valid price, likely subscription issue
+                self._mark_market_data_failure(symbol, "no valid price")
             except Exception as e:
                 error_msg = str(e)
                 logger.warning(f"IBKR price failed for {symbol}: {error_msg}")
                 self._mark_market_data_failure(symbol, error_msg)
 
-        # Try Yahoo Finance as fallback
+        # Try Yahoo Finance as fallback if IBKR didn't provide a valid price
         try:
             yahoo_price = self.yahoo.get_stock_price(symbol)
             if yahoo_price and yahoo_price > 0:
                 logger.debug(f"Using Yahoo price for {symbol}: ${yahoo_price:.2f}")
+                self._price_stats["yahoo_ok"] += 1
                 return yahoo_price
         except Exception as e:
             logger.warning(f"Yahoo price also failed for {symbol}: {e}")
+        self._price_stats["yahoo_fail"] += 1
 
         return None
 
+    async def _fetch_quote(self, symbol: str, snapshot_wait_s: float) -> float | None:
+        """Fetch a fresh price on the IBKR thread and cache it."""
+        loop = asyncio.get_event_loop()
+        price = await loop.run_in_executor(_executor, self._sync_get_price, symbol, snapshot_wait_s)
+        if price is not None:
+            self._quote_cache[symbol] = (time.monotonic(), price)
+        return price
+
+    async def get_quote(
+        self,
+        symbol: str,
+        max_age_s: float = 2.0,
+        snapshot_wait_s: float = _SNAPSHOT_WAIT_SECONDS,
+    ) -> float | None:
+        """Get a price for a symbol, reusing a cached quote younger than max_age_s."""
+        cached = self._quote_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < max_age_s:
+            return cached[1]
+        return await self._single_flight(
+            f"price:{symbol}", lambda: self._fetch_quote(symbol, snapshot_wait_s)
+        )
+
+    async def get_positions(self) -> list[Position]:
+        """Get all current positions."""
+        if not self.connected:
+            raise ConnectionError("Not connected to IBKR")
+
+        held = list(self._positions.items())
+        prices = await asyncio.gather(
+            *(
+                self.get_quote(
+                    symbol,
+                    max_age_s=_POSITION_QUOTE_MAX_AGE_SECONDS,
+                    snapshot_wait_s=_POSITION_SNAPSHOT_WAIT_SECONDS,
+                )
+                for symbol, _ in held
+            )
+        )
+
+        positions = []
+        for (symbol, state), price in zip(held, prices, strict=True):
+            if price is None:
+                self._price_stats["fallback_avg_cost"] += 1
+                price = state.avg_cost
+            positions.append(
+                Position(
+                    symbol=symbol,
+                    quantity=state.qty,
+                    avg_price=state.avg_cost,
+                    current_price=price,
+                )
+            )
+        return positions
+
     async def get_stock_price(self, symbol: str) -> float | None:
         """Get current price for a stock symbol with Yahoo fallback."""
-        contract = Stock(symbol, "SMART", "USD")
-        return await self._get_current_price(contract)
+        return await self.get_quote(symbol)
+
+    def _fill_latency_p95(self, order_type: OrderType) -> float | None:
+        """Get the p95 fill latency for an order type, refreshed at most once a minute."""
+        now = time.monotonic()
+        if now - self._fill_p95_refreshed_at > _FILL_P95_REFRESH_SECONDS:
+            self._fill_p95 = {
+                ot: statistics.quantiles(samples, n=20)[18]
+                for ot, samples in self._fill_latency.items()
+                if len(samples) >= _MIN_FILL_LATENCY_SAMPLES
+            }
+            self._fill_p95_refreshed_at = now
+        return self._fill_p95.get(order_type)
+
+    def _order_timeout(self, order: TradeOrder) -> float:
+        """Seconds to wait for an order to fill before cancelling it."""
+        if order.order_type == OrderType.LIMIT:
+            if order.expire_at is None:
+                return _MAX_LIMIT_TIMEOUT_SECONDS
+            remaining = (order.expire_at - datetime.now(UTC)).total_seconds()
+            return min(_MAX_LIMIT_TIMEOUT_SECONDS, max(0.0, remaining))
+
+        p95 = self._fill_latency_p95(order.order_type)
+        if p95 is None:
+            return _DEFAULT_MARKET_TIMEOUT_SECONDS
+        return max(_MIN_MARKET_TIMEOUT_SECONDS, 1.5 * p95)
 
     def _sync_execute_order(self, order: TradeOrder) -> dict:
         """Sync order execution - runs in thread."""
         try:
-            contract = Stock(order.symbol, "SMART", "USD")
-            self.ib.qualifyContracts(contract)
+            contract = self._qualified(order.symbol)
 
             if order.action == TradeAction.CLOSE:
-                ib_positions = self.ib.positions()
-                pos = next((p for p in ib_positions if p.contract.symbol == order.symbol), None)
+                pos = self._positions.get(order.symbol)
                 if not pos:
                     return {"success": False, "error": f"No position for {order.symbol}"}
-                ib_action = "SELL" if pos.position > 0 else "BUY"
-                quantity = abs(int(pos.position))
+                ib_action = "SELL" if pos.qty > 0 else "BUY"
+                quantity = abs(pos.qty)
             else:
                 ib_action = "BUY" if order.action == TradeAction.BUY else "SELL"
                 quantity = order.quantity
@@ -285,16 +513,18 @@ class IBKRClient:
             else:
                 ib_order = LimitOrder(ib_action, quantity, order.limit_price)
 
+            timeout = self._order_timeout(order)
+            started = time.monotonic()
             trade: IBTrade = self.ib.placeOrder(contract, ib_order)
 
-            start_time = datetime.now()
             while not trade.isDone():
                 self.ib.sleep(0.5)
-                if (datetime.now() - start_time).seconds > 30:
+                if time.monotonic() - started > timeout:
                     self.ib.cancelOrder(ib_order)
                     return {"success": False, "error": "Order timeout"}
 
             if trade.orderStatus.status == "Filled":
+                self._fill_latency[order.order_type].append(time.monotonic() - started)
                 fill = trade.fills[-1] if trade.fills else None
                 executed_price = fill.execution.price if fill else 0.0
                 commission = sum(
@@ -332,8 +562,26 @@ class IBKRClient:
                 error="Not connected to IBKR",
             )
 
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(_executor, self._sync_execute_order, order)
+        # Bulkhead: fail fast instead of queueing behind a saturated broker
+        try:
+            await asyncio.wait_for(self._order_slots.acquire(), _ORDER_SLOT_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning(f"Order for {order.symbol} rejected: {self._inflight_orders} in flight")
+            return TradeResult(
+                success=False,
+                symbol=order.symbol,
+                action=order.action,
+                quantity=order.quantity,
+                error="Too many orders in flight",
+            )
+
+        self._inflight_orders += 1
+        try:
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(_executor, self._sync_execute_order, order)
+        finally:
+            self._inflight_orders -= 1
+            self._order_slots.release()
 
         if result["success"]:
             return TradeResult(
@@ -1,12 +1,34 @@
 """Database connection and operations."""
 
-import json
+import math
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import orjson
 from loguru import logger
-from sqlalchemy import create_engine, desc
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    and_,
+    bindparam,
+    case,
+    cast,
+    create_engine,
+    desc,
+    event,
+    func,
+    insert,
+    select,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from src.database.models import (
     Base,
@@ -20,6 +42,72 @@ from src.database.models import (
     TradeRecord,
 )
 
+# Applied to every new SQLite connection. WAL lets dashboard reads run alongside
+# scheduler writes, and with synchronous=NORMAL commits no longer fsync individually.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+# How long rarely-changing lookups (config, initial value, last reflection) stay cached
+_READ_CACHE_TTL_SECONDS = 60.0
+
+# Background writer for fire-and-forget telemetry (log_async, save_portfolio_snapshot_async)
+_WRITE_QUEUE_MAXSIZE = 10000
+_WRITE_BATCH_SIZE = 500
+
+# Single-column indexes now covered by a composite index on the same leading column;
+# dropped from databases created before the composite existed
+_RETIRED_INDEXES = ("ix_trades_symbol", "ix_chat_messages_trading_session_id")
+
+# Per-tick lookups, built once so each call reuses the same statement and its compiled form
+_LATEST_REFLECTION_END: Select[tuple[datetime]] = (
+    select(Reflection.period_end).order_by(desc(Reflection.timestamp)).limit(1)
+)
+_latest_end = _LATEST_REFLECTION_END.scalar_subquery()
+_COUNT_TRADES_SINCE_LAST_REFLECTION = select(func.count(TradeRecord.id)).where(
+    # coalesce rather than OR keeps this a range seek on ix_trades_timestamp
+    TradeRecord.timestamp > func.coalesce(_latest_end, datetime.min)
+)
+_ACTIVE_INITIAL_VALUE: Select[tuple[float]] = (
+    select(InitialValueRecord.initial_value)
+    .where(InitialValueRecord.is_active)
+    .order_by(desc(InitialValueRecord.timestamp))
+    .limit(1)
+)
+_ACTIVE_INITIAL_VALUE_FOR_ACCOUNT = _ACTIVE_INITIAL_VALUE.where(
+    InitialValueRecord.account_id == bindparam("account_id")
+)
+_RECENT_TRADES = select(TradeRecord).order_by(desc(TradeRecord.timestamp)).limit(bindparam("count"))
+_CONFIG_VALUE: Select[tuple[str]] = select(SystemConfig.value).where(
+    SystemConfig.key == bindparam("key")
+)
+
+
+def _dumps(obj) -> str:
+    """Serialize a JSON payload column (non-str keys and numpy scalars allowed)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _apply_read_only_pragmas(dbapi_connection, connection_record):
+    """Configure a reader connection; query_only rejects any write on it."""
+    _apply_sqlite_pragmas(dbapi_connection, connection_record)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=1")
+    cursor.close()
+
 
 class Database:
     """Database manager for persistence."""
@@ -27,52 +115,226 @@ class Database:
     def __init__(self, db_path: str = "data/grok_trading.db"):
         self.db_path = db_path
         self._engine = None
+        self._read_engine = None
         self._session_factory = None
+        self._read_session_factory = None
+        # key -> (monotonic fetched_at, value); setters invalidate their entries
+        self._config_cache: dict[str, tuple[float, str | None]] = {}
+        self._initial_value_cache: dict[str | None, tuple[float, float | None]] = {}
+        self._reflection_time_cache: tuple[float, datetime | None] | None = None
+        self._write_q: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_MAXSIZE)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
 
     def init(self):
         """Initialize database and create tables."""
         # Ensure data directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        url = f"sqlite:///{self.db_path}"
+        connect_args = {"check_same_thread": False}
+
+        # Connections stay pooled for the process lifetime, so sessions no longer
+        # reopen the .db/-wal/-shm files. SQLite allows a single writer; the small
+        # write pool only absorbs contention, busy_timeout serialises the rest.
         self._engine = create_engine(
-            f"sqlite:///{self.db_path}", echo=False, connect_args={"check_same_thread": False}
+            url,
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=1,
+            max_overflow=2,
+            pool_recycle=-1,
+            insertmanyvalues_page_size=1000,
+            connect_args=connect_args,
         )
+        event.listen(self._engine, "connect", _apply_sqlite_pragmas)
         Base.metadata.create_all(self._engine)
-        self._session_factory = sessionmaker(bind=self._engine)
+        self._ensure_indexes()
+        # Keep committed attributes loaded so save_* can return records without a refresh SELECT
+        self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False)
+
+        # Readers get their own pool so dashboard polling never waits on a writer slot.
+        self._read_engine = create_engine(
+            url,
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_recycle=-1,
+            connect_args=connect_args,
+        )
+        event.listen(self._read_engine, "connect", _apply_read_only_pragmas)
+        self._read_session_factory = sessionmaker(bind=self._read_engine)
         logger.info(f"Database initialized: {self.db_path}")
 
+    def _ensure_indexes(self):
+        """Create indexes added after a table first shipped, drop retired ones, then
+        refresh planner stats.
+
+        create_all() skips tables that already exist, including their new indexes.
+        """
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self._engine, checkfirst=True)
+        with self._engine.begin() as conn:
+            for name in _RETIRED_INDEXES:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+            conn.exec_driver_sql("ANALYZE")
+
     def get_session(self) -> Session:
         """Get a new database session."""
         if self._session_factory is None:
             self.init()
         return self._session_factory()
 
-    # Trade Records
-    def save_trade(self, trade: dict) -> TradeRecord:
-        """Save a trade to the database."""
-        session = self.get_session()
+    def get_read_session(self) -> Session:
+        """Get a session on the read-only connection pool."""
+        if self._read_session_factory is None:
+            self.init()
+        return self._read_session_factory()
+
+    @contextmanager
+    def _session(self, write: bool = False) -> Iterator[Session]:
+        """Yield a session on the writer (commit on success) or read-only engine.
+
+        Rolls back on error and always closes, returning the connection to its pool.
+        """
+        session = self.get_session() if write else self.get_read_session()
         try:
-            record = TradeRecord(
-                order_id=trade.get("order_id") or trade.get("id"),
-                timestamp=trade.get("timestamp", datetime.utcnow()),
-                action=trade.get("action"),
-                symbol=trade.get("symbol"),
-                quantity=trade.get("quantity"),
-                price=trade.get("price"),
-                total_value=trade.get("total_value"),
-                fee=trade.get("fee", 0.0),
-                reasoning=trade.get("reasoning"),
-                evaluated_risk=trade.get("evaluated_risk", 50),
-                pnl=trade.get("pnl"),
-            )
+            yield session
+            if write:
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _bulk_insert(self, model, rows: list[dict]) -> int:
+        """Insert many rows in a single transaction without ORM hydration."""
+        if not rows:
+            return 0
+        with self._session(write=True) as session:
+            session.execute(insert(model), rows)
+        return len(rows)
+
+    def _enqueue_write(self, model, row: dict) -> None:
+        """Queue a row for the background writer, starting it if needed."""
+        if self._writer is None or not self._writer.is_alive():
+            with self._writer_lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(
+                        target=self._drain_writes, name="db-writer", daemon=True
+                    )
+                    self._writer.start()
+        try:
+            self._write_q.put_nowait((model, row))
+        except queue.Full:
+            logger.warning("Database write queue full, writing synchronously")
+            self._bulk_insert(model, [row])
+
+    def _drain_writes(self):
+        """Writer thread: commit queued rows in batches until a None sentinel arrives."""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    item = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[tuple]) -> None:
+        """Insert a batch of (model, row) pairs, one executemany per table, one commit."""
+        rows_by_model: dict[type, list[dict]] = {}
+        for model, row in batch:
+            rows_by_model.setdefault(model, []).append(row)
+        try:
+            with self._session(write=True) as session:
+                for model, rows in rows_by_model.items():
+                    session.execute(insert(model), rows)
+        except Exception as e:
+            logger.error(f"Background write of {len(batch)} rows failed: {e}")
+
+    def flush_writes(self, timeout: float = 10.0) -> None:
+        """Commit everything queued for the background writer and stop it."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        self._write_q.put(None)
+        writer.join(timeout)
+        self._writer = None
+
+    @contextmanager
+    def batch_commit(self, batch_size: int = 500) -> Iterator[Callable[[object], None]]:
+        """Yield an add(record) callable that commits once every batch_size records.
+
+        Whatever is still pending is committed on exit, or rolled back on error.
+        """
+        session = self.get_session()
+        pending = 0
+
+        def add(record: object) -> None:
+            nonlocal pending
             session.add(record)
+            pending += 1
+            if pending >= batch_size:
+                session.commit()
+                pending = 0
+
+        try:
+            yield add
             session.commit()
-            session.refresh(record)
-            logger.info(f"Trade saved: {record.symbol} {record.action}")
-            return record
+        except Exception:
+            session.rollback()
+            raise
         finally:
             session.close()
 
+    # Trade Records
+    @staticmethod
+    def _trade_row(trade: dict, now: datetime) -> dict:
+        """Map a trade dict onto TradeRecord columns; `now` stamps trades without a timestamp."""
+        return {
+            "order_id": trade.get("order_id") or trade.get("id"),
+            "timestamp": trade.get("timestamp", now),
+            "action": trade.get("action"),
+            "symbol": trade.get("symbol"),
+            "quantity": trade.get("quantity"),
+            "price": trade.get("price"),
+            "total_value": trade.get("total_value"),
+            "fee": trade.get("fee", 0.0),
+            "reasoning": trade.get("reasoning"),
+            "evaluated_risk": trade.get("evaluated_risk", 50),
+            "pnl": trade.get("pnl"),
+        }
+
+    def save_trade(self, trade: dict) -> TradeRecord:
+        """Save a trade to the database."""
+        with self._session(write=True) as session:
+            record = TradeRecord(**self._trade_row(trade, datetime.utcnow()))
+            session.add(record)
+        logger.info(f"Trade saved: {record.symbol} {record.action}")
+        return record
+
+    def save_trades_bulk(self, trades: list[dict]) -> int:
+        """Save many trades in one transaction. Returns the number inserted."""
+        now = datetime.utcnow()
+        count = self._bulk_insert(TradeRecord, [self._trade_row(t, now) for t in trades])
+        if count:
+            logger.info(f"Trades saved: {count}")
+        return count
+
     def get_trades(
         self,
         limit: int = 100,
@@ -82,8 +344,7 @@ class Database:
         end_date: datetime | None = None,
     ) -> list[TradeRecord]:
         """Get trade history with optional filters."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             query = session.query(TradeRecord).order_by(desc(TradeRecord.timestamp))
 
             if symbol:
@@ -94,50 +355,62 @@ class Database:
                 query = query.filter(TradeRecord.timestamp <= end_date)
 
             return query.offset(offset).limit(limit).all()
-        finally:
-            session.close()
 
     def get_trades_today(self) -> list[TradeRecord]:
-        """Get trades from today."""
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        """Get trades from today (UTC, the clock trade timestamps are stored in)."""
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
         return self.get_trades(start_date=today_start)
 
     def get_recent_trades(self, count: int = 5) -> list[TradeRecord]:
         """Get most recent trades."""
-        return self.get_trades(limit=count)
+        with self._session() as session:
+            return list(session.execute(_RECENT_TRADES, {"count": count}).scalars())
 
     # Chat Messages
     def save_chat_message(
         self, role: str, content: str, session_id: str | None = None, tokens: int | None = None
     ) -> ChatMessage:
         """Save a chat message."""
-        session = self.get_session()
-        try:
+        with self._session(write=True) as session:
             message = ChatMessage(
                 role=role, content=content, trading_session_id=session_id, tokens_used=tokens
             )
             session.add(message)
-            session.commit()
-            session.refresh(message)
-            return message
-        finally:
-            session.close()
+        return message
+
+    def save_chat_messages_bulk(self, messages: list[dict]) -> int:
+        """Save many chat messages (role, content, session_id, tokens, timestamp) in one
+        transaction. Messages without a timestamp get the time of the call."""
+        now = datetime.utcnow()
+        rows = [
+            {
+                "timestamp": m.get("timestamp") or now,
+                "role": m["role"],
+                "content": m["content"],
+                "trading_session_id": m.get("session_id"),
+                "tokens_used": m.get("tokens"),
+            }
+            for m in messages
+        ]
+        return self._bulk_insert(ChatMessage, rows)
 
     def get_chat_history(self, limit: int = 50, session_id: str | None = None) -> list[ChatMessage]:
         """Get chat history."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             query = session.query(ChatMessage).order_by(desc(ChatMessage.timestamp))
             if session_id:
                 query = query.filter(ChatMessage.trading_session_id == session_id)
             return query.limit(limit).all()
-        finally:
-            session.close()
 
     def get_recent_context(self, limit: int = 10) -> list[dict]:
         """Get recent chat messages formatted for API context."""
-        messages = self.get_chat_history(limit=limit)
-        return [{"role": m.role, "content": m.content} for m in reversed(messages)]
+        with self._session() as session:
+            rows: Sequence[Row[tuple[str, str]]] = session.execute(
+                select(ChatMessage.role, ChatMessage.content)
+                .order_by(desc(ChatMessage.timestamp))
+                .limit(limit)
+            ).all()
+        return [{"role": role, "content": content} for role, content in reversed(rows)]
 
     # Reflections
     def save_reflection(
@@ -153,8 +426,7 @@ class Database:
         sentiment: float | None = None,
     ) -> Reflection:
         """Save a reflection."""
-        session = self.get_session()
-        try:
+        with self._session(write=True) as session:
             reflection = Reflection(
                 content=content,
                 period_start=period_start,
@@ -167,20 +439,14 @@ class Database:
                 sentiment_score=sentiment,
             )
             session.add(reflection)
-            session.commit()
-            session.refresh(reflection)
-            logger.info(f"Reflection saved: {trades_analyzed} trades analyzed")
-            return reflection
-        finally:
-            session.close()
+        self._reflection_time_cache = None
+        logger.info(f"Reflection saved: {trades_analyzed} trades analyzed")
+        return reflection
 
     def get_reflections(self, limit: int = 10) -> list[Reflection]:
         """Get recent reflections."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             return session.query(Reflection).order_by(desc(Reflection.timestamp)).limit(limit).all()
-        finally:
-            session.close()
 
     def get_latest_reflection(self) -> Reflection | None:
         """Get the most recent reflection."""
@@ -189,22 +455,18 @@ class Database:
 
     def get_latest_reflection_time(self) -> datetime | None:
         """Get the end time of the last reflection period."""
-        reflection = self.get_latest_reflection()
-        if reflection:
-            return reflection.period_end
-        return None
+        cached = self._reflection_time_cache
+        if cached and time.monotonic() - cached[0] < _READ_CACHE_TTL_SECONDS:
+            return cached[1]
+        with self._session() as session:
+            period_end = session.execute(_LATEST_REFLECTION_END).scalar()
+        self._reflection_time_cache = (time.monotonic(), period_end)
+        return period_end
 
     def count_trades_since_last_reflection(self) -> int:
         """Count trades since the last reflection period ended."""
-        last_reflection_time = self.get_latest_reflection_time()
-        session = self.get_session()
-        try:
-            query = session.query(TradeRecord)
-            if last_reflection_time:
-                query = query.filter(TradeRecord.timestamp > last_reflection_time)
-            return query.count()
-        finally:
-            session.close()
+        with self._session() as session:
+            return session.execute(_COUNT_TRADES_SINCE_LAST_REFLECTION).scalar()
 
     # Portfolio Snapshots
     def save_portfolio_snapshot(
@@ -217,46 +479,77 @@ class Database:
         positions: list | None = None,
     ) -> PortfolioSnapshotRecord:
         """Save a portfolio snapshot."""
-        session = self.get_session()
-        try:
+        with self._session(write=True) as session:
             snapshot = PortfolioSnapshotRecord(
                 total_value=total_value,
                 cash=cash,
                 holdings_value=holdings_value,
                 pnl=pnl,
                 pnl_percent=pnl_percent,
-                positions_json=json.dumps(positions) if positions else None,
+                positions_json=_dumps(positions) if positions else None,
             )
             session.add(snapshot)
-            session.commit()
-            session.refresh(snapshot)
-            return snapshot
-        finally:
-            session.close()
+        return snapshot
+
+    def save_portfolio_snapshot_async(
+        self,
+        total_value: float,
+        cash: float,
+        holdings_value: float,
+        pnl: float = 0.0,
+        pnl_percent: float = 0.0,
+        positions: list | None = None,
+    ) -> None:
+        """Queue a portfolio snapshot for the background writer."""
+        self._enqueue_write(
+            PortfolioSnapshotRecord,
+            {
+                "timestamp": datetime.utcnow(),
+                "total_value": total_value,
+                "cash": cash,
+                "holdings_value": holdings_value,
+                "pnl": pnl,
+                "pnl_percent": pnl_percent,
+                "positions_json": _dumps(positions) if positions else None,
+            },
+        )
 
     def get_portfolio_history(
         self, hours: int = 24, limit: int = 1000
     ) -> list[PortfolioSnapshotRecord]:
-        """Get portfolio history for the last N hours."""
-        session = self.get_session()
-        try:
+        """Get portfolio history for the last N hours, downsampled to at most `limit` points.
+
+        The window is split into `limit` equal time buckets and the latest snapshot in
+        each bucket is returned, so long ranges still span the whole window.
+        """
+        with self._session() as session:
             start_time = datetime.utcnow() - timedelta(hours=hours)
-            return (
+            bucket_seconds = max(1, math.ceil(hours * 3600 / max(limit, 1)))
+            bucket = (
+                cast(func.strftime("%s", PortfolioSnapshotRecord.timestamp), Integer)
+                // bucket_seconds
+            )
+            latest_per_bucket: Select[tuple[int]] = (
+                select(func.max(PortfolioSnapshotRecord.id))
+                .where(PortfolioSnapshotRecord.timestamp >= start_time)
+                .group_by(bucket)
+            )
+            # Buckets are epoch-aligned, so the window can touch limit + 1 of them; keep the newest
+            snapshots = (
                 session.query(PortfolioSnapshotRecord)
-                .filter(PortfolioSnapshotRecord.timestamp >= start_time)
-                .order_by(PortfolioSnapshotRecord.timestamp)
+                .filter(PortfolioSnapshotRecord.id.in_(latest_per_bucket))
+                .order_by(desc(PortfolioSnapshotRecord.timestamp))
                 .limit(limit)
                 .all()
             )
-        finally:
-            session.close()
+            snapshots.reverse()
+            return snapshots
 
     def get_portfolio_history_range(
         self, start: datetime, end: datetime
     ) -> list[PortfolioSnapshotRecord]:
         """Get portfolio history for a date range."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             return (
                 session.query(PortfolioSnapshotRecord)
                 .filter(
@@ -266,8 +559,6 @@ class Database:
                 .order_by(PortfolioSnapshotRecord.timestamp)
                 .all()
             )
-        finally:
-            session.close()
 
     # System Logs
     def log(
@@ -278,135 +569,157 @@ class Database:
         details: dict | None = None,
     ) -> SystemLog:
         """Save a system log entry."""
-        session = self.get_session()
-        try:
+        with self._session(write=True) as session:
             log_entry = SystemLog(
                 level=level,
                 component=component,
                 message=message,
-                details=json.dumps(details) if details else None,
+                details=_dumps(details) if details else None,
             )
             session.add(log_entry)
-            session.commit()
-            session.refresh(log_entry)
-            return log_entry
-        finally:
-            session.close()
+        return log_entry
+
+    def log_async(
+        self,
+        message: str,
+        level: str = "INFO",
+        component: str | None = None,
+        details: dict | None = None,
+    ) -> None:
+        """Queue a system log entry for the background writer."""
+        self._enqueue_write(
+            SystemLog,
+            {
+                "timestamp": datetime.utcnow(),
+                "level": level,
+                "component": component,
+                "message": message,
+                "details": _dumps(details) if details else None,
+            },
+        )
+
+    def log_bulk(self, entries: list[dict]) -> int:
+        """Save many log entries (message, level, component, details) in one transaction."""
+        now = datetime.utcnow()
+        rows = [
+            {
+                "timestamp": now,
+                "level": e.get("level", "INFO"),
+                "component": e.get("component"),
+                "message": e["message"],
+                "details": _dumps(e["details"]) if e.get("details") else None,
+            }
+            for e in entries
+        ]
+        return self._bulk_insert(SystemLog, rows)
 
     def get_logs(
         self, limit: int = 100, level: str | None = None, component: str | None = None
     ) -> list[SystemLog]:
         """Get system logs."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             query = session.query(SystemLog).order_by(desc(SystemLog.timestamp))
             if level:
                 query = query.filter(SystemLog.level == level)
             if component:
                 query = query.filter(SystemLog.component == component)
             return query.limit(limit).all()
-        finally:
-            session.close()
 
     # Initial Value Tracking
     def get_initial_value(self, account_id: str | None = None) -> float | None:
         """Get the initial portfolio value."""
-        session = self.get_session()
-        try:
-            query = session.query(InitialValueRecord).filter(InitialValueRecord.is_active)
+        cached = self._initial_value_cache.get(account_id)
+        if cached and time.monotonic() - cached[0] < _READ_CACHE_TTL_SECONDS:
+            return cached[1]
+        with self._session() as session:
             if account_id:
-                query = query.filter(InitialValueRecord.account_id == account_id)
-            record = query.order_by(desc(InitialValueRecord.timestamp)).first()
-            return record.initial_value if record else None
-        finally:
-            session.close()
+                value = session.execute(
+                    _ACTIVE_INITIAL_VALUE_FOR_ACCOUNT, {"account_id": account_id}
+                ).scalar()
+            else:
+                value = session.execute(_ACTIVE_INITIAL_VALUE).scalar()
+        self._initial_value_cache[account_id] = (time.monotonic(), value)
+        return value
 
     def set_initial_value(self, value: float, account_id: str | None = None) -> InitialValueRecord:
         """Set the initial portfolio value."""
-        session = self.get_session()
-        try:
-            # Deactivate any existing initial values
+        with self._session(write=True) as session:
+            # Deactivate any existing initial values (fresh session: nothing loaded to sync)
             session.query(InitialValueRecord).filter(InitialValueRecord.is_active).update(
-                {"is_active": False}
+                {"is_active": False}, synchronize_session=False
             )
 
             # Create new record
             record = InitialValueRecord(initial_value=value, account_id=account_id, is_active=True)
             session.add(record)
-            session.commit()
-            session.refresh(record)
-            logger.info(f"Initial value set: ${value:,.2f}")
-            return record
-        finally:
-            session.close()
+        # Every other account's active record was just deactivated; the new row is now
+        # the only active one, so it answers both the unfiltered and its own lookup
+        now = time.monotonic()
+        self._initial_value_cache.clear()
+        self._initial_value_cache[None] = (now, value)
+        if account_id:
+            self._initial_value_cache[account_id] = (now, value)
+        logger.info(f"Initial value set: ${value:,.2f}")
+        return record
 
     # Statistics
     def get_trade_stats(self, days: int = 30) -> dict:
         """Get trading statistics for the last N days."""
-        session = self.get_session()
-        try:
-            start_date = datetime.now() - timedelta(days=days)
-            trades = session.query(TradeRecord).filter(TradeRecord.timestamp >= start_date).all()
-
-            if not trades:
-                return {
-                    "total_trades": 0,
-                    "total_volume": 0.0,
-                    "total_fees": 0.0,
-                    "realized_pnl": 0.0,
-                    "winning_trades": 0,
-                    "losing_trades": 0,
-                    "win_rate": 0.0,
-                }
-
-            total_volume = sum(t.total_value for t in trades)
-            total_fees = sum(t.fee for t in trades)
-
-            # Calculate PnL from SELL/CLOSE trades
-            sell_trades = [t for t in trades if t.action in ("sell", "close")]
-            realized_pnl = sum(t.pnl or 0 for t in sell_trades)
-
-            winning = len([t for t in sell_trades if (t.pnl or 0) > 0])
-            losing = len([t for t in sell_trades if (t.pnl or 0) < 0])
+        with self._session() as session:
+            start_date = datetime.utcnow() - timedelta(days=days)
+            closed: ColumnElement[bool] = TradeRecord.action.in_(("sell", "close"))
+            total, volume, fees, realized_pnl, winning, losing = (
+                session.query(
+                    func.count(),
+                    func.coalesce(func.sum(TradeRecord.total_value), 0.0),
+                    func.coalesce(func.sum(TradeRecord.fee), 0.0),
+                    # Realized PnL comes from SELL/CLOSE trades only
+                    func.coalesce(func.sum(case((closed, TradeRecord.pnl), else_=0.0)), 0.0),
+                    func.coalesce(
+                        func.sum(case((and_(closed, TradeRecord.pnl > 0), 1), else_=0)), 0
+                    ),
+                    func.coalesce(
+                        func.sum(case((and_(closed, TradeRecord.pnl < 0), 1), else_=0)), 0
+                    ),
+                )
+                .filter(TradeRecord.timestamp >= start_date)
+                .one()
+            )
             total_closed = winning + losing
 
             return {
-                "total_trades": len(trades),
-                "total_volume": total_volume,
-                "total_fees": total_fees,
-                "realized_pnl": realized_pnl,
+                "total_trades": total,
+                "total_volume": float(volume),
+                "total_fees": float(fees),
+                "realized_pnl": float(realized_pnl),
                 "winning_trades": winning,
                 "losing_trades": losing,
                 "win_rate": (winning / total_closed * 100) if total_closed > 0 else 0.0,
             }
-        finally:
-            session.close()
 
     # System Configuration
     def get_config(self, key: str, default: str | None = None) -> str | None:
         """Get a configuration value."""
-        session = self.get_session()
-        try:
-            config = session.query(SystemConfig).filter(SystemConfig.key == key).first()
-            return config.value if config else default
-        finally:
-            session.close()
+        cached = self._config_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _READ_CACHE_TTL_SECONDS:
+            value = cached[1]
+        else:
+            with self._session() as session:
+                value = session.execute(_CONFIG_VALUE, {"key": key}).scalar()
+            self._config_cache[key] = (time.monotonic(), value)
+        return value if value is not None else default
 
     def set_config(self, key: str, value: str) -> SystemConfig:
         """Set a configuration value."""
-        session = self.get_session()
-        try:
+        with self._session(write=True) as session:
             config = session.query(SystemConfig).filter(SystemConfig.key == key).first()
             if config:
                 config.value = value
             else:
                 config = SystemConfig(key=key, value=value)
                 session.add(config)
-            session.commit()
-            session.refresh(config)
-            return config
-        finally:
-            session.close()
+        self._config_cache.pop(key, None)
+        return config
 
     def get_scheduler_mode(self) -> str:
         """Get the scheduler mode (AUTO or MANUAL). Defaults to AUTO."""
@@ -431,54 +744,43 @@ class Database:
         trade_id: int | None = None,
     ) -> Decision:
         """Save a trading decision (including KEEP decisions)."""
-        session = self.get_session()
-        try:
+        with self._session(write=True) as session:
             decision = Decision(
                 action=action.lower(),
                 symbol=symbol,
                 quantity=quantity,
                 reasoning=reasoning,
-                context=json.dumps(context) if context else None,
+                context=_dumps(context) if context else None,
                 risk_score=risk_score,
                 trading_session_id=session_id,
                 executed=executed,
                 trade_id=trade_id,
             )
             session.add(decision)
-            session.commit()
-            session.refresh(decision)
-            logger.info(f"Decision saved: {action.upper()} {symbol or 'N/A'}")
-            return decision
-        finally:
-            session.close()
+        logger.info(f"Decision saved: {action.upper()} {symbol or 'N/A'}")
+        return decision
 
     def get_decisions(
         self, limit: int = 50, action: str | None = None, symbol: str | None = None
     ) -> list[Decision]:
         """Get decision history."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             query = session.query(Decision).order_by(desc(Decision.timestamp))
             if action:
                 query = query.filter(Decision.action == action.lower())
             if symbol:
                 query = query.filter(Decision.symbol == symbol)
             return query.limit(limit).all()
-        finally:
-            session.close()
 
     def get_decisions_by_session(self, session_id: str) -> list[Decision]:
         """Get all decisions for a trading session."""
-        session = self.get_session()
-        try:
+        with self._session() as session:
             return (
                 session.query(Decision)
                 .filter(Decision.trading_session_id == session_id)
                 .order_by(Decision.timestamp)
                 .all()
             )
-        finally:
-            session.close()
 
 
 # Singleton instance
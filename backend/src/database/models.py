@@ -3,12 +3,33 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, Text, text
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
 
+# Column attribute keys per mapped class, looked up once
+_column_keys: dict[type, frozenset[str]] = {}
+
+
+def _loaded_columns(record) -> dict:
+    """Return the record's column values, straight from its instance dict when possible.
+
+    Skips the instrumented-attribute descriptor on every field, which dominates
+    to_dict() on list endpoints. If any column is missing from the dict (unloaded,
+    expired or never set) every column is read through getattr instead.
+    """
+    cls = type(record)
+    keys = _column_keys.get(cls)
+    if keys is None:
+        keys = _column_keys[cls] = frozenset(p.key for p in record.__mapper__.column_attrs)
+    values = record.__dict__
+    if values.keys() >= keys:
+        return values
+    return {key: getattr(record, key) for key in keys}
+
+
 class TradeActionEnum(str, enum.Enum):
     BUY = "buy"
     SELL = "sell"
@@ -19,12 +40,13 @@ class TradeRecord(Base):
     """Persisted trade records."""
 
     __tablename__ = "trades"
+    __table_args__ = (Index("ix_trade_symbol_ts", "symbol", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     order_id = Column(String(50), unique=True, nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
     action = Column(String(10), nullable=False)
-    symbol = Column(String(10), nullable=False, index=True)
+    symbol = Column(String(10), nullable=False)
     quantity = Column(Integer, nullable=False)
     price = Column(Float, nullable=False)
     total_value = Column(Float, nullable=False)
@@ -34,19 +56,20 @@ class TradeRecord(Base):
     pnl = Column(Float, nullable=True)  # Realized P&L for SELL/CLOSE trades
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": str(self.id),
-            "order_id": self.order_id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "action": self.action,
-            "symbol": self.symbol,
-            "quantity": self.quantity,
-            "price": self.price,
-            "total_value": self.total_value,
-            "fee": self.fee,
-            "reasoning": self.reasoning,
-            "evaluated_risk": self.evaluated_risk,
-            "pnl": self.pnl,
+            "id": str(v["id"]),
+            "order_id": v["order_id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "action": v["action"],
+            "symbol": v["symbol"],
+            "quantity": v["quantity"],
+            "price": v["price"],
+            "total_value": v["total_value"],
+            "fee": v["fee"],
+            "reasoning": v["reasoning"],
+            "evaluated_risk": v["evaluated_risk"],
+            "pnl": v["pnl"],
         }
 
 
@@ -54,22 +77,24 @@ class ChatMessage(Base):
     """Chat history with Grok."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (Index("ix_chat_session_ts", "trading_session_id", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
     role = Column(String(20), nullable=False)  # system, user, assistant
     content = Column(Text, nullable=False)
-    trading_session_id = Column(String(50), nullable=True, index=True)
+    trading_session_id = Column(String(50), nullable=True)
     tokens_used = Column(Integer, nullable=True)
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "role": self.role,
-            "content": self.content,
-            "trading_session_id": self.trading_session_id,
-            "tokens_used": self.tokens_used,
+            "id": v["id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "role": v["role"],
+            "content": v["content"],
+            "trading_session_id": v["trading_session_id"],
+            "tokens_used": v["tokens_used"],
         }
 
 
@@ -91,18 +116,19 @@ class Reflection(Base):
     sentiment_score = Column(Float, nullable=True)  # -1 to 1
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "period_start": self.period_start.isoformat() if self.period_start else None,
-            "period_end": self.period_end.isoformat() if self.period_end else None,
-            "trades_analyzed": self.trades_analyzed,
-            "total_pnl": self.total_pnl,
-            "win_rate": self.win_rate,
-            "content": self.content,
-            "lessons_learned": self.lessons_learned,
-            "strategy_adjustments": self.strategy_adjustments,
-            "sentiment_score": self.sentiment_score,
+            "id": v["id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "period_start": v["period_start"].isoformat() if v["period_start"] else None,
+            "period_end": v["period_end"].isoformat() if v["period_end"] else None,
+            "trades_analyzed": v["trades_analyzed"],
+            "total_pnl": v["total_pnl"],
+            "win_rate": v["win_rate"],
+            "content": v["content"],
+            "lessons_learned": v["lessons_learned"],
+            "strategy_adjustments": v["strategy_adjustments"],
+            "sentiment_score": v["sentiment_score"],
         }
 
 
@@ -121,15 +147,16 @@ class PortfolioSnapshotRecord(Base):
     positions_json = Column(Text, nullable=True)  # JSON string of positions
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "total_value": self.total_value,
-            "cash": self.cash,
-            "holdings_value": self.holdings_value,
-            "pnl": self.pnl,
-            "pnl_percent": self.pnl_percent,
-            "positions_json": self.positions_json,
+            "id": v["id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "total_value": v["total_value"],
+            "cash": v["cash"],
+            "holdings_value": v["holdings_value"],
+            "pnl": v["pnl"],
+            "pnl_percent": v["pnl_percent"],
+            "positions_json": v["positions_json"],
         }
 
 
@@ -137,6 +164,10 @@ class SystemLog(Base):
     """System activity logs."""
 
     __tablename__ = "system_logs"
+    __table_args__ = (
+        Index("ix_log_level_comp_ts", "level", "component", "timestamp"),
+        Index("ix_log_level_ts", "level", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
@@ -146,13 +177,14 @@ class SystemLog(Base):
     details = Column(Text, nullable=True)  # JSON string for additional data
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "level": self.level,
-            "component": self.component,
-            "message": self.message,
-            "details": self.details,
+            "id": v["id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "level": v["level"],
+            "component": v["component"],
+            "message": v["message"],
+            "details": v["details"],
         }
 
 
@@ -160,6 +192,10 @@ class InitialValueRecord(Base):
     """Store the initial portfolio value for accurate P&L tracking."""
 
     __tablename__ = "initial_values"
+    # Only active rows are ever read; the partial index stays a handful of entries
+    __table_args__ = (
+        Index("ix_initial_active_ts", "timestamp", sqlite_where=text("is_active = 1")),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
@@ -168,12 +204,13 @@ class InitialValueRecord(Base):
     is_active = Column(Boolean, default=True)
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "initial_value": self.initial_value,
-            "account_id": self.account_id,
-            "is_active": self.is_active,
+            "id": v["id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "initial_value": v["initial_value"],
+            "account_id": v["account_id"],
+            "is_active": v["is_active"],
         }
 
 
@@ -181,18 +218,19 @@ class SystemConfig(Base):
     """System configuration storage (scheduler mode, settings, etc.)."""
 
     __tablename__ = "system_config"
+    # Looked up by key only: cluster rows on it. Older databases keep their id column.
+    __table_args__ = {"sqlite_with_rowid": False}
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    key = Column(String(50), unique=True, nullable=False, index=True)
+    key = Column(String(50), primary_key=True)
     value = Column(String(255), nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "key": self.key,
-            "value": self.value,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "key": v["key"],
+            "value": v["value"],
+            "updated_at": v["updated_at"].isoformat() if v["updated_at"] else None,
         }
 
 
@@ -207,6 +245,7 @@ class Decision(Base):
     """All trading decisions made by Grok (including KEEP decisions)."""
 
     __tablename__ = "decisions"
+    __table_args__ = (Index("ix_decision_action_symbol_ts", "action", "symbol", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
@@ -221,16 +260,17 @@ class Decision(Base):
     trade_id = Column(Integer, nullable=True)  # Reference to trades table if executed
 
     def to_dict(self) -> dict:
+        v = _loaded_columns(self)
         return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "action": self.action,
-            "symbol": self.symbol,
-            "quantity": self.quantity,
-            "reasoning": self.reasoning,
-            "context": self.context,
-            "risk_score": self.risk_score,
-            "trading_session_id": self.trading_session_id,
-            "executed": self.executed,
-            "trade_id": self.trade_id,
+            "id": v["id"],
+            "timestamp": v["timestamp"].isoformat() if v["timestamp"] else None,
+            "action": v["action"],
+            "symbol": v["symbol"],
+            "quantity": v["quantity"],
+            "reasoning": v["reasoning"],
+            "context": v["context"],
+            "risk_score": v["risk_score"],
+            "trading_session_id": v["trading_session_id"],
+            "executed": v["executed"],
+            "trade_id": v["trade_id"],
         }
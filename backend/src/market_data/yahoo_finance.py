@@ -1,22 +1,112 @@
+import threading
+import time
+
 import yfinance as yf
 from loguru import logger
 
+# Successful lookups are reused for this long; failures are never cached
+_PRICE_TTL_SECONDS = 30.0
+_INFO_TTL_SECONDS = 3600.0
+_CACHE_MAX_ENTRIES = 256
+
+# yfinance doesn't have built-in search; search_stocks matches against these names
+_COMMON_STOCKS = (
+    ("apple", "AAPL"),
+    ("microsoft", "MSFT"),
+    ("google", "GOOGL"),
+    ("amazon", "AMZN"),
+    ("nvidia", "NVDA"),
+    ("meta", "META"),
+    ("tesla", "TSLA"),
+    ("netflix", "NFLX"),
+    ("amd", "AMD"),
+    ("intel", "INTC"),
+)
+
 
 class YahooFinanceClient:
     """Market data provider using Yahoo Finance."""
 
+    def __init__(self):
+        # symbol -> (monotonic stored_at, value); shared by the event loop and IBKR executor
+        self._price_cache: dict[str, tuple[float, float]] = {}
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, cache: dict, symbol: str, ttl: float):
+        """Return the cached value for symbol if younger than ttl, else None."""
+        with self._cache_lock:
+            entry = cache.get(symbol)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    def _cache_put(self, cache: dict, symbol: str, value, ttl: float) -> None:
+        """Store a value, dropping expired entries once the cache is full."""
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(cache) >= _CACHE_MAX_ENTRIES:
+                for key in [k for k, (stored_at, _) in cache.items() if now - stored_at >= ttl]:
+                    del cache[key]
+                if len(cache) >= _CACHE_MAX_ENTRIES:
+                    cache.clear()
+            cache[symbol] = (now, value)
+
     def get_stock_price(self, symbol: str) -> float | None:
-        """Get current stock price."""
+        """Get current stock price (cached for 30s)."""
+        cached = self._cache_get(self._price_cache, symbol, _PRICE_TTL_SECONDS)
+        if cached is not None:
+            return cached
         try:
             ticker = yf.Ticker(symbol)
             data = ticker.history(period="1d")
             if not data.empty:
-                return float(data["Close"].iloc[-1])
+                price = float(data["Close"].iloc[-1])
+                self._cache_put(self._price_cache, symbol, price, _PRICE_TTL_SECONDS)
+                return price
             return None
         except Exception as e:
             logger.error(f"Failed to get price for {symbol}: {e}")
             return None
 
+    def get_stock_prices(self, symbols: list[str]) -> dict[str, float]:
+        """Get current prices for several symbols with one batched download (cached for 30s).
+
+        Symbols without a price are left out of the result.
+        """
+        prices = {}
+        missing = []
+        for symbol in symbols:
+            cached = self._cache_get(self._price_cache, symbol, _PRICE_TTL_SECONDS)
+            if cached is not None:
+                prices[symbol] = cached
+            else:
+                missing.append(symbol)
+        if not missing:
+            return prices
+
+        try:
+            data = yf.download(
+                missing, period="1d", group_by="ticker", progress=False, threads=True
+            )
+        except Exception as e:
+            logger.error(f"Failed to get prices for {', '.join(missing)}: {e}")
+            return prices
+        if data is None or data.empty:
+            return prices
+
+        for symbol in missing:
+            try:
+                frame = data[symbol] if data.columns.nlevels > 1 else data
+                closes = frame["Close"].dropna()
+            except KeyError:
+                continue
+            if not closes.empty:
+                price = float(closes.iloc[-1])
+                self._cache_put(self._price_cache, symbol, price, _PRICE_TTL_SECONDS)
+                prices[symbol] = price
+        return prices
+
     def get_price_history(
         self, symbol: str, period: str = "1mo", interval: str = "1d"
     ) -> list[dict]:
@@ -34,32 +124,42 @@ class YahooFinanceClient:
             ticker = yf.Ticker(symbol)
             data = ticker.history(period=period, interval=interval)
 
-            history = []
-            for idx, row in data.iterrows():
-                history.append(
-                    {
-                        "date": idx.strftime("%Y-%m-%d %H:%M"),
-                        "open": float(row["Open"]),
-                        "high": float(row["High"]),
-                        "low": float(row["Low"]),
-                        "close": float(row["Close"]),
-                        "volume": int(row["Volume"]),
-                    }
-                )
-
-            return history
+            # Pull whole columns out once instead of building a Series per row
+            columns = zip(
+                data.index.strftime("%Y-%m-%d %H:%M").tolist(),
+                data["Open"].tolist(),
+                data["High"].tolist(),
+                data["Low"].tolist(),
+                data["Close"].tolist(),
+                data["Volume"].tolist(),
+                strict=True,
+            )
+            return [
+                {
+                    "date": date,
+                    "open": float(open_),
+                    "high": float(high),
+                    "low": float(low),
+                    "close": float(close),
+                    "volume": int(volume),
+                }
+                for date, open_, high, low, close, volume in columns
+            ]
 
         except Exception as e:
             logger.error(f"Failed to get history for {symbol}: {e}")
             return []
 
     def get_stock_info(self, symbol: str) -> dict:
-        """Get stock information."""
+        """Get stock information (cached for 1h)."""
+        cached = self._cache_get(self._info_cache, symbol, _INFO_TTL_SECONDS)
+        if cached is not None:
+            return dict(cached)
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
 
-            return {
+            stock_info = {
                 "symbol": symbol,
                 "name": info.get("longName", symbol),
                 "sector": info.get("sector", "Unknown"),
@@ -71,6 +171,8 @@ class YahooFinanceClient:
                 "52_week_low": info.get("fiftyTwoWeekLow", 0),
                 "avg_volume": info.get("averageVolume", 0),
             }
+            self._cache_put(self._info_cache, symbol, stock_info, _INFO_TTL_SECONDS)
+            return dict(stock_info)
 
         except Exception as e:
             logger.error(f"Failed to get info for {symbol}: {e}")
@@ -84,25 +186,12 @@ class YahooFinanceClient:
     def search_stocks(self, query: str) -> list[dict]:
         """Search for stocks by query."""
         try:
-            # yfinance doesn't have built-in search, return common matches
-            common_stocks = {
-                "apple": "AAPL",
-                "microsoft": "MSFT",
-                "google": "GOOGL",
-                "amazon": "AMZN",
-                "nvidia": "NVDA",
-                "meta": "META",
-                "tesla": "TSLA",
-                "netflix": "NFLX",
-                "amd": "AMD",
-                "intel": "INTC",
-            }
-
             query_lower = query.lower()
+            query_upper = query.upper()
             results = []
 
-            for name, symbol in common_stocks.items():
-                if query_lower in name or query_lower.upper() == symbol:
+            for name, symbol in _COMMON_STOCKS:
+                if query_lower in name or query_upper == symbol:
                     info = self.get_stock_info(symbol)
                     results.append(info)
 
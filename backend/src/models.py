@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import AwareDatetime, BaseModel, Field, computed_field
 
 
 class AgentStatus(str, Enum):
@@ -28,28 +28,23 @@ class Position(BaseModel):
     avg_price: float
     current_price: float = 0.0
 
+    @computed_field
     @property
     def value(self) -> float:
         return self.quantity * self.current_price
 
+    @computed_field
     @property
     def pnl(self) -> float:
         return (self.current_price - self.avg_price) * self.quantity
 
+    @computed_field
     @property
     def pnl_percent(self) -> float:
         if self.avg_price == 0:
             return 0.0
         return ((self.current_price - self.avg_price) / self.avg_price) * 100
 
-    def model_dump(self, **kwargs):
-        """Include computed properties in serialization."""
-        data = super().model_dump(**kwargs)
-        data["value"] = self.value
-        data["pnl"] = self.pnl
-        data["pnl_percent"] = self.pnl_percent
-        return data
-
 
 class TradeOrder(BaseModel):
     symbol: str
@@ -57,6 +52,9 @@ class TradeOrder(BaseModel):
     order_type: OrderType = OrderType.MARKET
     quantity: int
     limit_price: float | None = None
+    # Limit orders only: must be timezone-aware. The fill wait stops at the earlier of
+    # expire_at and 30s; an order still working then is cancelled.
+    expire_at: AwareDatetime | None = None
     reasoning: str = ""
     evaluated_risk: int = Field(default=50, ge=0, le=100)
 
@@ -1,8 +1,11 @@
 """Trading scheduler for autonomous trading loop."""
 
 import asyncio
+import threading
 from collections.abc import Callable
 from datetime import datetime, time
+from functools import lru_cache
+from time import monotonic
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -22,6 +25,14 @@ AFTER_HOURS_CLOSE = time(20, 0)
 # Timezone
 ET = ZoneInfo("America/New_York")
 
+# Reflection schedules: fixed, stateless, so built once and shared by every start()
+_DAILY_REFLECTION_TRIGGER = CronTrigger(hour=16, minute=5, timezone=ET)
+_WEEKLY_REFLECTION_TRIGGER = CronTrigger(day_of_week="fri", hour=16, minute=30, timezone=ET)
+
+# get_market_status() result is reused for this long (callers often ask 2-3 times per tick)
+_STATUS_CACHE_SECONDS = 0.5
+_status_cache: tuple[float, str] | None = None
+
 
 class MarketStatus:
     """Market status enumeration."""
@@ -32,8 +43,30 @@ class MarketStatus:
     AFTER_HOURS = "AFTER_HOURS"
 
 
+_TRADING_HOURS_STATUSES = frozenset(
+    {MarketStatus.PRE_MARKET, MarketStatus.OPEN, MarketStatus.AFTER_HOURS}
+)
+
+
 def get_market_status() -> str:
-    """Get current market status based on Eastern Time."""
+    """Get current market status based on Eastern Time (cached for 500ms)."""
+    global _status_cache
+    checked_at = monotonic()
+    if _status_cache and checked_at - _status_cache[0] < _STATUS_CACHE_SECONDS:
+        return _status_cache[1]
+    status = _compute_market_status()
+    _status_cache = (checked_at, status)
+    return status
+
+
+def clear_market_status_cache() -> None:
+    """Drop the cached status so the next call recomputes it."""
+    global _status_cache
+    _status_cache = None
+
+
+def _compute_market_status() -> str:
+    """Compute market status from the current Eastern Time."""
     now = datetime.now(ET)
     current_time = now.time()
     weekday = now.weekday()
@@ -64,8 +97,7 @@ def is_market_open() -> bool:
 
 def is_trading_hours() -> bool:
     """Check if within extended trading hours (pre + regular + after)."""
-    status = get_market_status()
-    return status in [MarketStatus.PRE_MARKET, MarketStatus.OPEN, MarketStatus.AFTER_HOURS]
+    return get_market_status() in _TRADING_HOURS_STATUSES
 
 
 class TradingScheduler:
@@ -80,6 +112,10 @@ class TradingScheduler:
         self._reflection_callback: Callable | None = None
         self._is_running = False
         self._trade_count_since_reflection = 0
+        self._background_tasks: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None  # Captured in start()
+        self._next_runs_key: tuple | None = None
+        self._next_runs: list[dict] = []
         # Load mode from database (defaults to AUTO)
         self._mode = self.db.get_scheduler_mode()
         logger.info(f"Scheduler mode loaded from database: {self._mode}")
@@ -95,12 +131,13 @@ class TradingScheduler:
         return self._mode
 
     def set_mode(self, mode: str):
-        """Set trading mode (MANUAL or AUTO) and persist to database."""
-        if mode.upper() in ["MANUAL", "AUTO"]:
-            self._mode = mode.upper()
+        """Set trading mode (MANUAL or AUTO) and persist to database if it changed."""
+        mode = mode.upper()
+        if mode in ["MANUAL", "AUTO"] and mode != self._mode:
+            self._mode = mode
             # Persist to database
             self.db.set_scheduler_mode(self._mode)
-            self.db.log(
+            self.db.log_async(
                 message=f"Trading mode set to {self._mode}", component="scheduler", level="INFO"
             )
             logger.info(f"Trading mode: {self._mode}")
@@ -131,23 +168,46 @@ class TradingScheduler:
     def increment_trade_count(self):
         """Increment trade count and check if reflection threshold reached."""
         self._trade_count_since_reflection += 1
+        count = self._trade_count_since_reflection
         threshold = self.settings.reflection_trades_threshold
 
-        logger.info(f"Trade count: {self._trade_count_since_reflection}/{threshold}")
-
-        if self._trade_count_since_reflection >= threshold:
+        if count < threshold:
+            logger.debug(f"Trade count: {count}/{threshold}")
+        else:
             logger.info(f"Trade threshold ({threshold}) reached - triggering reflection")
-            self.db.log(
-                message=f"Trade threshold reached ({self._trade_count_since_reflection} trades) - triggering reflection",
+            self.db.log_async(
+                message=f"Trade threshold reached ({count} trades) - triggering reflection",
                 component="scheduler",
                 level="INFO",
             )
             self._trigger_trade_count_reflection()
 
+    def _spawn(self, coro) -> None:
+        """Run a job in the background on the scheduler's loop, from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self._loop is None and running is None:
+            # Not started and called off-loop: run it to completion on its own thread
+            threading.Thread(target=asyncio.run, args=(coro,), daemon=True).start()
+        elif self._loop is None or running is self._loop:
+            self._start_task(coro)
+        else:
+            self._loop.call_soon_threadsafe(self._start_task, coro)
+
+    def _start_task(self, coro) -> asyncio.Task:
+        """Create the job's task on this loop, holding a reference until it finishes."""
+        loop = self._loop or asyncio.get_running_loop()
+        task = loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     def _trigger_trade_count_reflection(self):
         """Trigger a reflection based on trade count threshold."""
         if self._reflection_callback:
-            asyncio.create_task(self._execute_reflection())
+            self._spawn(self._execute_reflection())
             # Reset count after triggering
             self._trade_count_since_reflection = 0
 
@@ -155,30 +215,34 @@ class TradingScheduler:
         """Reset trade count (called after reflection completes)."""
         self._trade_count_since_reflection = 0
 
+    def _should_trade_now(self, market_status: str) -> bool:
+        """Only trade in AUTO mode during market hours."""
+        if self._mode != "AUTO":
+            logger.debug("Skipping trade - not in AUTO mode")
+            return False
+        if market_status != MarketStatus.OPEN:
+            logger.debug(f"Skipping trade - market is {market_status}")
+            return False
+        return True
+
     async def _execute_trading_loop(self):
         """Execute the trading loop if conditions are met."""
         try:
             market_status = get_market_status()
 
             # Log market status
-            self.db.log(
+            self.db.log_async(
                 message=f"Trading check - Market: {market_status}, Mode: {self._mode}",
                 component="scheduler",
                 level="DEBUG",
             )
 
-            # Only trade in AUTO mode during market hours
-            if self._mode != "AUTO":
-                logger.debug("Skipping trade - not in AUTO mode")
-                return
-
-            if not is_market_open():
-                logger.debug(f"Skipping trade - market is {market_status}")
+            if not self._should_trade_now(market_status):
                 return
 
             if self._trading_callback:
                 logger.info("Executing scheduled trading loop...")
-                self.db.log(
+                self.db.log_async(
                     message="Starting scheduled analysis and trade",
                     component="scheduler",
                     level="INFO",
@@ -189,12 +253,18 @@ class TradingScheduler:
 
         except Exception as e:
             logger.error(f"Trading loop error: {e}")
-            self.db.log(
+            self.db.log_async(
                 message=f"Trading loop error: {str(e)}", component="scheduler", level="ERROR"
             )
 
-    async def _execute_snapshot(self):
-        """Take a portfolio snapshot."""
+    async def _execute_snapshot(self, trading_hours_job: bool = True):
+        """Take a portfolio snapshot.
+
+        Two jobs share this: a 1-minute one that only fires during trading hours
+        and a 15-minute one that covers nights and weekends.
+        """
+        if is_trading_hours() != trading_hours_job:
+            return
         try:
             if self._snapshot_callback:
                 await self._snapshot_callback()
@@ -227,7 +297,7 @@ class TradingScheduler:
             replace_existing=True,
         )
 
-        # Portfolio snapshot - every 1 minute for real-time updates
+        # Portfolio snapshot - every 1 minute for real-time updates during trading hours
         self.scheduler.add_job(
             self._execute_snapshot,
             IntervalTrigger(minutes=1),
@@ -236,10 +306,20 @@ class TradingScheduler:
             replace_existing=True,
         )
 
+        # Portfolio snapshot - every 15 minutes outside trading hours
+        self.scheduler.add_job(
+            self._execute_snapshot,
+            IntervalTrigger(minutes=15),
+            kwargs={"trading_hours_job": False},
+            id="portfolio_snapshot_off_hours",
+            name="Portfolio Snapshot (Off Hours)",
+            replace_existing=True,
+        )
+
         # Daily reflection - at market close (4:05 PM ET)
         self.scheduler.add_job(
             self._execute_reflection,
-            CronTrigger(hour=16, minute=5, timezone=ET),
+            _DAILY_REFLECTION_TRIGGER,
             id="daily_reflection",
             name="Daily Trading Reflection",
             replace_existing=True,
@@ -248,16 +328,17 @@ class TradingScheduler:
         # Weekly reflection - Friday at 4:30 PM ET
         self.scheduler.add_job(
             self._execute_reflection,
-            CronTrigger(day_of_week="fri", hour=16, minute=30, timezone=ET),
+            _WEEKLY_REFLECTION_TRIGGER,
             id="weekly_reflection",
             name="Weekly Trading Reflection",
             replace_existing=True,
         )
 
         self.scheduler.start()
+        self._loop = asyncio.get_running_loop()
         self._is_running = True
 
-        self.db.log(
+        self.db.log_async(
             message=f"Scheduler started - trading interval: {interval_minutes} minutes",
             component="scheduler",
             level="INFO",
@@ -272,29 +353,35 @@ class TradingScheduler:
         self.scheduler.shutdown(wait=False)
         self._is_running = False
 
-        self.db.log(message="Scheduler stopped", component="scheduler", level="INFO")
+        self.db.log_async(message="Scheduler stopped", component="scheduler", level="INFO")
         logger.info("Scheduler stopped")
 
     def get_next_run_times(self) -> list[dict]:
-        """Get next scheduled run times for all jobs."""
-        jobs = []
-        for job in self.scheduler.get_jobs():
-            next_run = job.next_run_time
-            jobs.append(
+        """Get next scheduled run times for all jobs.
+
+        The serialized list is reused until a job is added, removed or
+        rescheduled, so status polling between fires does no isoformat work.
+        """
+        jobs = self.scheduler.get_jobs()
+        key = tuple((job.id, job.next_run_time) for job in jobs)
+        if key != self._next_runs_key:
+            self._next_runs = [
                 {
                     "id": job.id,
                     "name": job.name,
-                    "next_run": next_run.isoformat() if next_run else None,
+                    "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
                 }
-            )
-        return jobs
+                for job in jobs
+            ]
+            self._next_runs_key = key
+        return self._next_runs
 
     def trigger_now(self, job_id: str = "trading_loop"):
         """Manually trigger a job."""
         job = self.scheduler.get_job(job_id)
         if job:
             logger.info(f"Manually triggering job: {job_id}")
-            asyncio.create_task(self._execute_trading_loop())
+            self._spawn(self._execute_trading_loop())
         else:
             logger.warning(f"Job not found: {job_id}")
 
@@ -312,13 +399,7 @@ class TradingScheduler:
         }
 
 
-# Singleton instance
-_scheduler: TradingScheduler | None = None
-
-
+@lru_cache
 def get_scheduler() -> TradingScheduler:
     """Get the scheduler singleton."""
-    global _scheduler
-    if _scheduler is None:
-        _scheduler = TradingScheduler()
-    return _scheduler
+    return TradingScheduler()
@@ -5,23 +5,35 @@ Run with: python tests/test_grok_connection.py
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.agent.grok_client import GrokClient
-from src.config import get_settings
+
+@pytest.fixture(scope="module")
+def client():
+    """One client for the module; imported lazily so collection stays cheap."""
+    from src.config import get_settings
+
+    if not get_settings().xai_api_key:
+        pytest.skip("XAI_API_KEY not set")
+
+    from src.agent.grok_client import GrokClient
+
+    return GrokClient()
 
 
-def test_grok_connection():
+def test_grok_connection(client):
     """Test basic Grok API connection with minimal tokens."""
+    from src.config import get_settings
+
     print("Testing Grok API connection...")
     print(f"Model: {get_settings().xai_model}")
 
-    client = GrokClient()
-
     # Simple test with minimal tokens
     try:
         response = client.chat(
@@ -40,12 +52,10 @@ def test_grok_connection():
         return False
 
 
-def test_trading_analysis():
+def test_trading_analysis(client):
     """Test a simple trading analysis."""
     print("\nTesting trading analysis (minimal)...")
 
-    client = GrokClient()
-
     try:
         # Minimal analysis test
         decision = client.decide_trade(
@@ -69,7 +79,10 @@ def test_trading_analysis():
 
 
 if __name__ == "__main__":
-    success = test_grok_connection()
+    from src.agent.grok_client import GrokClient
+
+    grok = GrokClient()
+    success = test_grok_connection(grok)
     if success:
-        test_trading_analysis()
+        test_trading_analysis(grok)
     sys.exit(0 if success else 1)
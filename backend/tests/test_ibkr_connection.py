@@ -10,11 +10,11 @@ from pathlib import Path
 # Add src to path for standalone execution
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.broker.ibkr_client import IBKRClient
-
 
 async def test_connection():
     """Test basic IBKR connection."""
+    from src.broker.ibkr_client import IBKRClient
+
     print("Testing IBKR connection...")
 
     client = IBKRClient()